@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class HomeConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "home"
+
+    def ready(self):
+        """
+        Pre-compile the block templates so the first request does not
+        pay the template-loader cold cache miss, and block renders can
+        reuse the compiled Template objects directly.
+        """
+        from django.template.loader import get_template
+
+        from .blocks import CachedStructBlock
+
+        for block_cls in CachedStructBlock.__subclasses__():
+            template_name = getattr(block_cls._meta_class, "template", None)
+            if template_name:
+                block_cls._compiled_template = get_template(template_name)
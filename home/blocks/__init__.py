@@ -0,0 +1,34 @@
+"""
+Lazy re-exports for the UnityAid StreamField blocks.
+
+The block classes live in ``home.blocks._blocks``; this package defers
+importing that module (and its Wagtail admin/images dependencies) until
+a block name is first accessed, per PEP 562.
+"""
+
+from importlib import import_module
+
+__all__ = [
+    "CachedStructBlock",
+    "CachedStructBlockAdapter",
+    "FastURLBlock",
+    "PrefetchImageChooserBlock",
+    "HeroBlock",
+    "StatsBlock",
+    "ImpactStatisticBlock",
+    "SectionHeaderBlock",
+    "ProjectCardBlock",
+    "ProjectCardsBlock",
+    "TeamMemberBlock",
+    "TeamSectionBlock",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return getattr(import_module("._blocks", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,801 @@
+"""
+==============================================
+Wagtail StreamField Blocks for UnityAid Project
+==============================================
+
+This module defines reusable and flexible content blocks
+for building dynamic and visually engaging pages using
+Wagtail CMS StreamFields.
+
+Blocks Included:
+----------------
+1. HeroBlock              – Defines a full-width banner section with image and CTA buttons.
+2. StatsBlock             – Represents individual statistics with icons and numeric labels.
+3. ImpactStatisticBlock   – Displays grouped statistical metrics to showcase organization impact.
+4. SectionHeaderBlock     – Displays a section header with title, optional subtitle, and centering option.
+5. ProjectCardBlock       – Displays a project card with image, title, location, description, and status.
+6. ProjectCardsBlock      – Displays a section with multiple project cards in a grid layout.
+
+Author:
+--------
+Jobet Casquejo
+Date:
+-----
+November 2025
+Version:
+--------
+1.0
+"""
+
+import copy
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.utils.functional import cached_property
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from wagtail import blocks
+from wagtail.admin.telepath import register
+from wagtail.blocks.struct_block import StructBlockAdapter
+from wagtail.images.blocks import ImageChooserBlock
+
+
+# ======================================================
+# SHARED META BASE
+# ======================================================
+class _BaseMeta:
+    """
+    Shared base for the inner ``Meta`` classes of the blocks below.
+
+    Declares ``__slots__`` so the Meta classes themselves contribute no
+    per-instance ``__dict__`` when Wagtail composes them into each
+    block's ``_meta_class``, and gives future shared Meta options a
+    single place to live.
+    """
+
+    __slots__ = ()
+
+
+# Compiled per-class method specializations, keyed by (block class,
+# child block names). See CachedStructBlock.clean.
+_COMPILED_CLEANS = {}
+_COMPILED_TO_PYTHONS = {}
+_COMPILED_PREP_VALUES = {}
+
+
+def _compile_clean(child_block_names):
+    """
+    Generate a clean() specialization with the child-block loop of
+    StructBlock.clean unrolled for a fixed set of field names.
+
+    The generated function is compiled once per block class and cached,
+    removing the per-call dict iteration and name lookups from the
+    validation hot path while preserving StructBlock.clean semantics
+    (per-child errors are collected and raised together as a
+    StructBlockValidationError).
+    """
+    lines = [
+        "def _clean(self, value):",
+        "    child_blocks = self.child_blocks",
+        "    result = []",
+        "    errors = {}",
+    ]
+    for name in child_block_names:
+        lines += [
+            "    try:",
+            f"        result.append(({name!r}, child_blocks[{name!r}].clean(value[{name!r}])))",
+            "    except ValidationError as e:",
+            f"        errors[{name!r}] = e",
+        ]
+    lines += [
+        "    if errors:",
+        "        raise StructBlockValidationError(errors)",
+        "    return self._to_struct_value(result)",
+    ]
+    namespace = {
+        "ValidationError": ValidationError,
+        "StructBlockValidationError": blocks.StructBlockValidationError,
+    }
+    exec(compile("\n".join(lines), "<compiled clean>", "exec"), namespace)
+    return namespace["_clean"]
+
+
+def _compile_to_python(child_block_names):
+    """
+    Generate a to_python() specialization with the child-block loop of
+    StructBlock.to_python unrolled for a fixed set of field names.
+    Missing keys fall back to the child block's default, matching the
+    stock implementation.
+    """
+    items = ", ".join(
+        f"({name!r}, child_blocks[{name!r}].to_python(value[{name!r}])"
+        f" if {name!r} in value else child_blocks[{name!r}].get_default())"
+        for name in child_block_names
+    )
+    source = (
+        "def _to_python(self, value):\n"
+        "    child_blocks = self.child_blocks\n"
+        f"    return self._to_struct_value([{items}])"
+    )
+    namespace = {}
+    exec(compile(source, "<compiled to_python>", "exec"), namespace)
+    return namespace["_to_python"]
+
+
+def _compile_get_prep_value(child_block_names):
+    """
+    Generate a get_prep_value() specialization returning the serialized
+    dict with the per-field dispatch unrolled. Only used for values
+    carrying the full field set; see CachedStructBlock.get_prep_value.
+    """
+    items = ", ".join(
+        f"{name!r}: child_blocks[{name!r}].get_prep_value(value[{name!r}])"
+        for name in child_block_names
+    )
+    source = (
+        "def _get_prep_value(self, value):\n"
+        "    child_blocks = self.child_blocks\n"
+        f"    return {{{items}}}"
+    )
+    namespace = {}
+    exec(compile(source, "<compiled get_prep_value>", "exec"), namespace)
+    return namespace["_get_prep_value"]
+
+
+# ======================================================
+# CACHED STRUCT BLOCK BASE
+# ======================================================
+class CachedStructBlock(blocks.StructBlock):
+    """
+    Base class for the custom StructBlocks in this module.
+
+    Block definitions are immutable once the module has loaded, so the
+    per-render work Wagtail does to serialize them for the admin editor
+    can safely be computed once per block instance and reused. The
+    matching ``CachedStructBlockAdapter`` below memoizes that
+    serialization, so admin form renders scale with the number of unique
+    block types rather than the number of rendered instances.
+    """
+
+    @cached_property
+    def _child_block_names(self):
+        """Child block names in declaration order, frozen per instance."""
+        return tuple(self.child_blocks)
+
+    @cached_property
+    def _child_block_name_set(self):
+        return frozenset(self._child_block_names)
+
+    @cached_property
+    def _compiled_clean(self):
+        """The per-class clean() specialization for this instance."""
+        key = (type(self), self._child_block_names)
+        try:
+            return _COMPILED_CLEANS[key]
+        except KeyError:
+            return _COMPILED_CLEANS.setdefault(key, _compile_clean(self._child_block_names))
+
+    @cached_property
+    def _compiled_to_python(self):
+        key = (type(self), self._child_block_names)
+        try:
+            return _COMPILED_TO_PYTHONS[key]
+        except KeyError:
+            return _COMPILED_TO_PYTHONS.setdefault(
+                key, _compile_to_python(self._child_block_names)
+            )
+
+    @cached_property
+    def _compiled_get_prep_value(self):
+        key = (type(self), self._child_block_names)
+        try:
+            return _COMPILED_PREP_VALUES[key]
+        except KeyError:
+            return _COMPILED_PREP_VALUES.setdefault(
+                key, _compile_get_prep_value(self._child_block_names)
+            )
+
+    def clean(self, value):
+        if value.keys() != self._child_block_name_set:
+            # partial or exotic values (e.g. API callers passing a
+            # subset of fields) take the generic path
+            return super().clean(value)
+        return self._compiled_clean(self, value)
+
+    def to_python(self, value):
+        return self._compiled_to_python(self, value)
+
+    def get_prep_value(self, value):
+        if value.keys() != self._child_block_name_set:
+            return super().get_prep_value(value)
+        return self._compiled_get_prep_value(self, value)
+
+    # Compiled Template object for Meta.template, set per subclass by
+    # HomeConfig.ready() so rendering skips the template-loader lookup.
+    _compiled_template = None
+
+    def render(self, value, context=None):
+        template = type(self)._compiled_template
+        if template is None or template.origin.template_name != self.get_template(
+            value, context=context
+        ):
+            return super().render(value, context)
+
+        if context is None:
+            new_context = self.get_context(value)
+        else:
+            new_context = self.get_context(value, parent_context=dict(context))
+        return mark_safe(template.render(new_context))
+
+
+class CachedStructBlockAdapter(StructBlockAdapter):
+    """
+    Telepath adapter for ``CachedStructBlock`` that memoizes ``js_args``
+    per block instance instead of rebuilding the meta dict on every
+    admin page load.
+    """
+
+    def js_args(self, block):
+        try:
+            return block._cached_js_args
+        except AttributeError:
+            block._cached_js_args = super().js_args(block)
+            return block._cached_js_args
+
+
+register(CachedStructBlockAdapter(), CachedStructBlock)
+
+
+# ======================================================
+# RENDITION-PREFETCHING IMAGE CHOOSER
+# ======================================================
+class PrefetchImageChooserBlock(ImageChooserBlock):
+    """
+    ImageChooserBlock that prefetches known renditions during batch
+    conversion.
+
+    ``rendition_specs`` should list the exact filter specs the block's
+    template requests (e.g. ``width-800``), so that ``{% image %}`` can
+    resolve each rendition from the prefetched cache instead of issuing
+    one rendition query per image.
+    """
+
+    def __init__(self, *args, rendition_specs=(), **kwargs):
+        self._rendition_specs = tuple(rendition_specs)
+        super().__init__(*args, **kwargs)
+
+    def bulk_to_python(self, values):
+        if not self._rendition_specs:
+            return super().bulk_to_python(values)
+
+        objects = self.model_class.objects.prefetch_renditions(
+            *self._rendition_specs
+        ).in_bulk(values)
+
+        # mirror ChooserBlock.bulk_to_python: keep ordering and None
+        # values, and give repeated IDs distinct instances
+        seen_ids = set()
+        result = []
+        for image_id in values:
+            image = objects.get(image_id)
+            if image is not None and image_id in seen_ids:
+                image = copy.copy(image)
+            result.append(image)
+            seen_ids.add(image_id)
+        return result
+
+
+# ======================================================
+# SHARED CHOICE DEFINITIONS
+# ======================================================
+# Frozen module-level tuples shared by every block instance, so the
+# choice sets are allocated once per process instead of once per import
+# of each class body.
+_HERO_HEIGHT_CHOICES = (
+    ('full', 'Full Screen'),
+    ('medium', 'Medium Height'),
+    ('small', 'Small Height'),
+)
+
+_ICON_CHOICES = (
+    ('users', 'Users'),
+    ('utensils', 'Utensils'),
+    ('heart', 'Heart'),
+    ('globe', 'Globe'),
+)
+
+_STATUS_CHOICES = (
+    ('Active', 'Active'),
+    ('Ongoing', 'Ongoing'),
+    ('Completed', 'Completed'),
+)
+
+# Help texts shared across the block definitions below. Keeping them in
+# one module-level dict interns each string once per process, de-dupes
+# texts reused by several blocks, and gives i18n a single place to wrap
+# values with gettext_lazy later.
+_HELP = {
+    'main_heading': "Main heading text",
+    'optional_subtitle': "Optional subtitle text",
+    'hero_background_image': "Background image for hero section",
+    'hero_primary_button_text': "Text for primary button",
+    'hero_secondary_button_text': "Text for secondary button",
+    'hero_primary_button_link': "Link for primary button",
+    'hero_secondary_button_link': "Link for secondary button",
+    'hero_height': "Hero section height",
+    'stat_icon': "Icon representing the statistic",
+    'stat_number': "Main numeric value",
+    'stat_label': "Description of the statistic",
+    'stat_suffix': "Optional suffix like '+'",
+    'impact_title': "Title for the statistics section",
+    'impact_subtitle': "Subtitle for the statistics section",
+    'impact_stats': "List of impact statistics",
+    'header_centered': "Center-align the header text",
+    'project_image': "Project image",
+    'project_title': "Project title",
+    'project_location': "Project location",
+    'project_description': "Project description",
+    'project_status': "Project status",
+    'project_link': "Optional link to project details page",
+    'projects_title': "Optional title for the projects section",
+    'projects_subtitle': "Optional subtitle for the projects section",
+    'projects_list': "List of project cards",
+    'team_member_image': "Team member image",
+    'team_member_name': "Team member name",
+    'team_member_role': "Team member role",
+    'team_member_linkedin': "Team member LinkedIn profile",
+    'team_title': "Section title",
+    'team_subtitle': "Optional section subtitle",
+    'team_members': "List of team members",
+}
+
+# Bootstrap icon classes keyed by the `icon_name` choices above,
+# mirroring the mapping in blocks/stats.html.
+_STAT_ICON_CLASSES = {
+    'users': 'bi-people-fill',
+    'utensils': 'bi-utensils-fill',
+    'heart': 'bi-heart-fill',
+    'globe': 'bi-globe',
+}
+
+
+# ======================================================
+# SHARED URL VALIDATION
+# ======================================================
+# One validator instance - and therefore one lazily-compiled regex -
+# shared by every URL field below, pinned to the only schemes the site
+# links out with.
+_URL_VALIDATOR = URLValidator(schemes=['http', 'https'])
+
+
+class FastURLBlock(blocks.URLBlock):
+    """
+    URLBlock whose field validates against the shared ``_URL_VALIDATOR``
+    instead of a per-field URLValidator, so saving a page with many
+    cards exercises a single compiled regex and rejects non-web schemes
+    like ftp up front.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.field.validators = [
+            _URL_VALIDATOR if isinstance(validator, URLValidator) else validator
+            for validator in self.field.validators
+        ]
+
+
+# ======================================================
+# SHARED CHOOSER PROTOTYPES
+# ======================================================
+# Wagtail requires every declared child block to be a distinct instance
+# (set_name mutates it), so semantically identical choosers cannot be
+# shared outright. Shallow-copying a prototype is considerably cheaper
+# than re-running the chooser constructors, whose field/widget setup is
+# deferred behind cached_property and therefore not copied at all.
+_PAGE_LINK_PROTOTYPE = blocks.PageChooserBlock(
+    required=False,
+    page_type=['home.HomePage'],
+    can_choose_root=False,
+)
+
+_REQUIRED_IMAGE_PROTOTYPE = PrefetchImageChooserBlock(required=True)
+
+
+def _clone_block(prototype, **overrides):
+    """
+    Return a shallow copy of ``prototype`` safe to declare as a child
+    block, with its own meta, constructor args and definition-registry
+    entry, and any ``overrides`` applied to the recorded kwargs.
+    """
+    block = copy.copy(prototype)
+    block.meta = copy.copy(prototype.meta)
+    args, kwargs = prototype._constructor_args
+    block._constructor_args = (args, {**kwargs, **overrides})
+    block.creation_counter = blocks.Block.creation_counter
+    blocks.Block.creation_counter += 1
+    block.definition_prefix = "blockdef-%d" % block.creation_counter
+    blocks.Block.definition_registry[block.definition_prefix] = block
+    return block
+
+
+def _page_link(help_text):
+    """An optional HomePage chooser cloned from the shared prototype."""
+    block = _clone_block(_PAGE_LINK_PROTOTYPE, help_text=help_text)
+    block._help_text = help_text
+    return block
+
+
+def _required_image(help_text, rendition_specs):
+    """A required image chooser cloned from the shared prototype."""
+    block = _clone_block(
+        _REQUIRED_IMAGE_PROTOTYPE,
+        help_text=help_text,
+        rendition_specs=rendition_specs,
+    )
+    block._help_text = help_text
+    block._rendition_specs = tuple(rendition_specs)
+    return block
+
+
+def _format_count(number):
+    """
+    Mirror the `|default:'0'|floatformat:0` filter chain used by
+    blocks/stats.html: round numeric values to whole numbers and pass
+    non-numeric values (e.g. '10k') through unchanged.
+    """
+    if not number:
+        return '0'
+    try:
+        return str(Decimal(str(number)).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+    except InvalidOperation:
+        return str(number)
+
+
+# ======================================================
+# 1. HERO SECTION BLOCK
+# ======================================================
+class HeroBlock(CachedStructBlock):
+    """
+    Represents a hero banner section that appears at the top of a page.
+
+    Attributes:
+    -----------
+    title : CharBlock
+        The main heading displayed prominently.
+    subtitle : TextBlock
+        Optional supporting text below the title.
+    background_image : ImageChooserBlock
+        Background image for the hero section.
+    primary_button_text : CharBlock
+        Text for the main (primary) button.
+    secondary_button_text : CharBlock
+        Text for the secondary button.
+    primary_button_link : PageChooserBlock
+        Page linked to the primary button.
+    secondary_button_link : PageChooserBlock
+        Page linked to the secondary button.
+    height : ChoiceBlock
+        Determines the height of the hero section (full, medium, small).
+    """
+
+    title = blocks.CharBlock(required=True, help_text=_HELP['main_heading'])
+    subtitle = blocks.TextBlock(required=False, help_text=_HELP['optional_subtitle'])
+    background_image = _required_image(_HELP['hero_background_image'], ('original',))
+
+    primary_button_text = blocks.CharBlock(required=False, help_text=_HELP['hero_primary_button_text'])
+    secondary_button_text = blocks.CharBlock(required=False, help_text=_HELP['hero_secondary_button_text'])
+
+    primary_button_link = _page_link(_HELP['hero_primary_button_link'])
+    secondary_button_link = _page_link(_HELP['hero_secondary_button_link'])
+
+    height = blocks.ChoiceBlock(
+        choices=_HERO_HEIGHT_CHOICES,
+        default='full',
+        help_text=_HELP['hero_height'],
+    )
+
+    _page_link_names = ("primary_button_link", "secondary_button_link")
+
+    def bulk_to_python(self, values):
+        """
+        Resolve both button-link page fields with a single query.
+
+        The stock StructBlock implementation batches each chooser field
+        separately, which still costs one query per link field. Both
+        links chose from the same model, so their IDs can be fetched
+        together with one ``in_bulk`` call.
+        """
+        page_model = self.child_blocks[self._page_link_names[0]].model_class
+        page_ids = {
+            value[name]
+            for value in values
+            for name in self._page_link_names
+            if value.get(name) is not None
+        }
+        pages = page_model.objects.in_bulk(page_ids) if page_ids else {}
+
+        stripped = [
+            {name: val for name, val in value.items() if name not in self._page_link_names}
+            for value in values
+        ]
+        results = super().bulk_to_python(stripped)
+
+        seen_ids = set()
+        for value, result in zip(values, results):
+            for name in self._page_link_names:
+                page_id = value.get(name)
+                page = pages.get(page_id)
+                if page is not None and page_id in seen_ids:
+                    # distinct instances per occurrence, matching
+                    # ChooserBlock.bulk_to_python behaviour
+                    page = copy.copy(page)
+                result[name] = page
+                seen_ids.add(page_id)
+        return results
+
+    class Meta(_BaseMeta):
+        template = "blocks/hero.html"
+        icon = "image"
+        label = "Hero Section"
+
+
+# ======================================================
+# 2. STATISTICS ITEM BLOCK
+# ======================================================
+class StatsBlock(CachedStructBlock):
+    """
+    Represents an individual statistical item displayed
+    in an impact or metrics section.
+
+    Attributes:
+    -----------
+    icon_name : ChoiceBlock
+        Icon identifier for visual representation.
+    number : CharBlock
+        Numerical value or metric (e.g., '500', '10k').
+    label : CharBlock
+        Descriptive text for the statistic.
+    suffix : CharBlock
+        Optional text displayed after the number (e.g., '+', '%').
+    """
+
+    icon_name = blocks.ChoiceBlock(
+        choices=_ICON_CHOICES,
+        required=True,
+        help_text=_HELP['stat_icon']
+    )
+    number = blocks.CharBlock(required=True, max_length=20, help_text=_HELP['stat_number'])
+    label = blocks.CharBlock(required=True, max_length=50, help_text=_HELP['stat_label'])
+    suffix = blocks.CharBlock(required=False, max_length=5, help_text=_HELP['stat_suffix'])
+
+    def render(self, value, context=None):
+        """
+        Render directly with string formatting when no extra context is
+        supplied, bypassing the template engine for this trivial block.
+        Callers that pass a context (e.g. `{% include_block %}` inside
+        another template) still go through blocks/stats.html.
+        """
+        if context:
+            return super().render(value, context)
+
+        icon_name = value.get('icon_name')
+        icon_html = (
+            format_html(
+                '<div class="stat-icon-wrapper"><i class="bi {}"></i></div>',
+                _STAT_ICON_CLASSES.get(icon_name, 'bi-circle-fill'),
+            )
+            if icon_name
+            else ''
+        )
+        suffix = value.get('suffix')
+        suffix_html = (
+            format_html('<span class="stat-suffix">{}</span>', suffix) if suffix else ''
+        )
+        return format_html(
+            '<div class="stat-card">{}'
+            '<div class="stat-number" data-count="{}">'
+            '<span class="stat-number-value">0</span>{}'
+            '</div>'
+            '<p class="stat-label">{}</p>'
+            '</div>',
+            icon_html,
+            _format_count(value.get('number')),
+            suffix_html,
+            value.get('label') or '',
+        )
+
+    class Meta(_BaseMeta):
+        template = "blocks/stats.html"
+        icon = "pick"
+        label = "Statistics Block"
+
+
+# ======================================================
+# 3. IMPACT STATISTICS SECTION BLOCK
+# ======================================================
+class ImpactStatisticBlock(CachedStructBlock):
+    """
+    Represents a section that groups multiple statistics together,
+    often used to showcase organizational achievements or metrics.
+
+    Attributes:
+    -----------
+    section_title : CharBlock
+        Main heading of the section.
+    section_subtitle : TextBlock
+        Optional subtitle or context for the section.
+    stats : ListBlock
+        A list of `StatsBlock` items to display.
+    """
+
+    section_title = blocks.CharBlock(required=True, max_length=100, help_text=_HELP['impact_title'])
+    section_subtitle = blocks.TextBlock(required=False, help_text=_HELP['impact_subtitle'])
+    stats = blocks.ListBlock(StatsBlock(), min_num=1, max_num=12, help_text=_HELP['impact_stats'])
+
+    class Meta(_BaseMeta):
+        template = "blocks/impact_statistics.html"
+        icon = "group"
+        label = "Impact Statistics Section"
+
+
+# ======================================================
+# 4. SECTION HEADER BLOCK
+# ======================================================
+class SectionHeaderBlock(CachedStructBlock):
+    """
+    Represents a section header with a title, optional subtitle,
+    and optional text centering.
+
+    Attributes:
+    -----------
+    title : CharBlock
+        The main heading text (required).
+    subtitle : TextBlock
+        Optional subtitle text displayed below the title.
+    centered : BooleanBlock
+        Whether to center-align the text (default: True).
+    """
+
+    title = blocks.CharBlock(required=True, help_text=_HELP['main_heading'])
+    subtitle = blocks.TextBlock(required=False, help_text=_HELP['optional_subtitle'])
+    centered = blocks.BooleanBlock(
+        required=False,
+        default=True,
+        help_text=_HELP['header_centered']
+    )
+
+    def render(self, value, context=None):
+        """
+        Render directly with string formatting when no extra context is
+        supplied, bypassing the template engine for this trivial block.
+        Callers that pass a context still go through
+        blocks/section_header.html.
+        """
+        if context:
+            return super().render(value, context)
+
+        centered = value.get('centered')
+        subtitle = value.get('subtitle')
+        subtitle_html = (
+            format_html(
+                '<p class="section-header-subtitle{}">{}</p>',
+                ' mx-auto' if centered else '',
+                subtitle,
+            )
+            if subtitle
+            else ''
+        )
+        return format_html(
+            '<div class="section-header mb-5{}">'
+            '<h2 class="section-header-title mb-4 position-relative d-inline-block">'
+            '{}<div class="section-header-underline"></div>'
+            '</h2>{}'
+            '</div>',
+            ' text-center' if centered else '',
+            value.get('title') or '',
+            subtitle_html,
+        )
+
+    class Meta(_BaseMeta):
+        template = "blocks/section_header.html"
+        icon = "title"
+        label = "Section Header"
+
+
+# ======================================================
+# 5. PROJECT CARD BLOCK
+# ======================================================
+class ProjectCardBlock(CachedStructBlock):
+    """
+    Represents a project card displaying project information
+    with an image, title, location, description, and status.
+
+    Attributes:
+    -----------
+    image : ImageChooserBlock
+        Project image displayed at the top of the card.
+    title : CharBlock
+        Project title (required).
+    location : CharBlock
+        Project location (required).
+    description : TextBlock
+        Project description (required).
+    status : ChoiceBlock
+        Project status (Active, Ongoing, or Completed).
+    link : URLBlock
+        Optional link to the project page or details.
+    """
+
+    image = _required_image(_HELP['project_image'], ('width-800',))
+    title = blocks.CharBlock(required=True, max_length=200, help_text=_HELP['project_title'])
+    location = blocks.CharBlock(required=True, max_length=100, help_text=_HELP['project_location'])
+    description = blocks.TextBlock(required=True, help_text=_HELP['project_description'])
+    status = blocks.ChoiceBlock(
+        choices=_STATUS_CHOICES,
+        required=True,
+        default='Active',
+        help_text=_HELP['project_status']
+    )
+    link = FastURLBlock(required=False, help_text=_HELP['project_link'])
+
+    class Meta(_BaseMeta):
+        template = "blocks/project_card.html"
+        icon = "doc-full"
+        label = "Project Card"
+
+
+# ======================================================
+# 6. PROJECT CARDS SECTION BLOCK
+# ======================================================
+class ProjectCardsBlock(CachedStructBlock):
+    """
+    Represents a section that groups multiple project cards together,
+    often used to showcase multiple projects in a grid layout.
+
+    Attributes:
+    -----------
+    section_title : CharBlock
+        Optional title for the projects section.
+    section_subtitle : TextBlock
+        Optional subtitle for the projects section.
+    projects : ListBlock
+        A list of `ProjectCardBlock` items to display.
+    """
+
+    section_title = blocks.CharBlock(required=False, max_length=200, help_text=_HELP['projects_title'])
+    section_subtitle = blocks.TextBlock(required=False, help_text=_HELP['projects_subtitle'])
+    projects = blocks.ListBlock(ProjectCardBlock(), min_num=1, max_num=24, help_text=_HELP['projects_list'])
+
+    class Meta(_BaseMeta):
+        template = "blocks/project_cards.html"
+        icon = "folder"
+        label = "Project Cards Section"
+
+# ======================================================
+# 7. TeamMemberBlocks
+# ======================================================
+class TeamMemberBlock(CachedStructBlock):
+    image = _required_image(_HELP['team_member_image'], ('fill-400x400',))
+    name = blocks.CharBlock(required=True, max_length=100, help_text=_HELP['team_member_name'])
+    role = blocks.CharBlock(required=True, max_length=100, help_text=_HELP['team_member_role'])
+    linkedIn = FastURLBlock(required=False, help_text=_HELP['team_member_linkedin'])
+
+    class Meta(_BaseMeta):
+        icon = "user"
+        label = "Team Member"
+        template = "blocks/team_member.html"
+
+# ======================================================
+# 8. TeamSectionBlock
+# ======================================================
+class TeamSectionBlock(CachedStructBlock):
+    title = blocks.CharBlock(required=True, default="Our Team", help_text=_HELP['team_title'])
+    subtitle = blocks.TextBlock(required=False, help_text=_HELP['team_subtitle'])
+    members = blocks.ListBlock(TeamMemberBlock(), min_num=1, max_num=24, help_text=_HELP['team_members'])
+
+    class Meta(_BaseMeta):
+        icon = "group"
+        label = "Team Section"
+        template = "blocks/team_section.html"
\ No newline at end of file
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 07:50
+
+import home.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0011_alter_homepage_content'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='homepage',
+            name='content',
+            field=home.models.CompactStreamField([], blank=True, help_text='Composable content blocks for the home page.', null=True),
+        ),
+    ]
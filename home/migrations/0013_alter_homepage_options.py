@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 07:59
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0012_alter_homepage_content'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='homepage',
+            options={'verbose_name': 'Home Page', 'verbose_name_plural': 'Home Pages'},
+        ),
+    ]
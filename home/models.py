@@ -48,6 +48,38 @@ from .blocks import (
     TeamSectionBlock
 )
 
+class CompactStreamField(StreamField):
+    """
+    StreamField whose deconstructed form omits the nested block
+    definitions.
+
+    The stock deconstruct() serializes every block in the field - for
+    HomePage.content that is the full eight-block tree, making each
+    auto-migration hundreds of lines and regenerating all of it whenever
+    any block changes. The blocks do not affect the database schema
+    (the column is JSON either way), so migrations only need the plain
+    field kwargs.
+    """
+
+    def deconstruct(self):
+        name, path, _args, kwargs = super().deconstruct()
+        kwargs.pop("block_lookup", None)
+        return name, path, [[]], kwargs
+
+
+# Block types available in HomePage.content, built once at module scope
+# so each block class is instantiated a single time per process.
+_HOMEPAGE_BLOCKS = (
+    ('hero_section', HeroBlock()),
+    ('section_header', SectionHeaderBlock()),
+    ('stats', StatsBlock()),
+    ('impact_statistic', ImpactStatisticBlock()),
+    ('project_card', ProjectCardBlock()),
+    ('project_cards', ProjectCardsBlock()),
+    ('team_member', TeamMemberBlock()),
+    ('team_section', TeamSectionBlock()),
+)
+
 
 # ======================================================
 # HOMEPAGE MODEL
@@ -70,17 +102,8 @@ class HomePage(Page):
         Optional subtitle displayed under the page title.
     """
 
-    content = StreamField(
-        [
-            ('hero_section', HeroBlock()),
-            ('section_header', SectionHeaderBlock()),
-            ('stats', StatsBlock()),
-            ('impact_statistic', ImpactStatisticBlock()),
-            ('project_card', ProjectCardBlock()),
-            ('project_cards', ProjectCardsBlock()),
-            ('team_member', TeamMemberBlock()),
-            ('team_section', TeamSectionBlock()),
-        ],
+    content = CompactStreamField(
+        _HOMEPAGE_BLOCKS,
         use_json_field=True,
         null=True,
         blank=True,
@@ -102,7 +125,6 @@ class HomePage(Page):
     class Meta:
         verbose_name = "Home Page"
         verbose_name_plural = "Home Pages"
-        ordering = ["title"]
 
     def __str__(self):
         """
@@ -1,6 +1,8 @@
 from django.urls import reverse
+from home.blocks import HeroBlock, StatsBlock
 from home.models import HomePage
 
+from wagtail.blocks import StructBlockValidationError
 from wagtail.models import Page
 from wagtail.test.utils import WagtailPageTestCase
 
@@ -41,3 +43,63 @@ class HomeTests(WagtailPageTestCase):
     def test_homepage_template_used(self):
         response = self.client.get(reverse("home"))
         self.assertTemplateUsed(response, "home/home_page.html")
+
+
+class HeroBlockTests(WagtailPageTestCase):
+    """
+    Tests for the batched page lookups in HeroBlock.bulk_to_python.
+    """
+
+    def setUp(self):
+        root_page = Page.objects.get(pk=1)
+        self.homepage = HomePage(title="Home")
+        root_page.add_child(instance=self.homepage)
+
+    def test_bulk_to_python_resolves_button_links(self):
+        block = HeroBlock()
+        values = block.bulk_to_python([
+            {
+                "title": "Welcome",
+                "primary_button_link": self.homepage.pk,
+                "secondary_button_link": self.homepage.pk,
+            },
+            {"title": "Second hero", "primary_button_link": None},
+        ])
+        self.assertEqual(values[0]["title"], "Welcome")
+        self.assertEqual(values[0]["primary_button_link"].pk, self.homepage.pk)
+        self.assertEqual(values[0]["secondary_button_link"].pk, self.homepage.pk)
+        self.assertIsNone(values[1]["primary_button_link"])
+        self.assertIsNone(values[1]["secondary_button_link"])
+
+    def test_bulk_to_python_uses_single_page_query(self):
+        block = HeroBlock()
+        raw = [
+            {"title": "A", "primary_button_link": self.homepage.pk},
+            {"title": "B", "secondary_button_link": self.homepage.pk},
+        ]
+        with self.assertNumQueries(1):
+            block.bulk_to_python(raw)
+
+
+class CompiledCleanTests(WagtailPageTestCase):
+    """
+    Tests for the compiled clean() specialization on CachedStructBlock.
+    """
+
+    def test_clean_returns_validated_struct_value(self):
+        block = StatsBlock()
+        value = block.to_python(
+            {"icon_name": "users", "number": "500", "label": "Families", "suffix": "+"}
+        )
+        cleaned = block.clean(value)
+        self.assertEqual(cleaned["number"], "500")
+        self.assertEqual(cleaned["label"], "Families")
+
+    def test_clean_collects_per_field_errors(self):
+        block = StatsBlock()
+        value = block.to_python(
+            {"icon_name": "users", "number": "500", "label": "", "suffix": ""}
+        )
+        with self.assertRaises(StructBlockValidationError) as ctx:
+            block.clean(value)
+        self.assertIn("label", ctx.exception.block_errors)
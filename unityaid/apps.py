@@ -0,0 +1,18 @@
+"""
+Project-level Django app configuration overrides for unityaid.
+"""
+
+from wagtail.images.apps import WagtailImagesAppConfig
+
+
+class CustomImagesAppConfig(WagtailImagesAppConfig):
+    """
+    Wagtail images app config with lazy-loading defaults.
+
+    Every `{% image %}` tag emits `decoding="async" loading="lazy"` so
+    below-the-fold images (project cards, team photos) no longer block
+    initial layout. Templates rendering the LCP image should override
+    these with `loading="eager"` on the tag itself.
+    """
+
+    default_attrs = {"decoding": "async", "loading": "lazy"}